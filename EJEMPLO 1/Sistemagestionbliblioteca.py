@@ -1,6 +1,15 @@
+import logging
+import sys
+import time
+import warnings
 from abc import ABC, abstractmethod
+from array import array
+from bisect import bisect_left
 from datetime import datetime, timedelta
-from typing import List, Dict, Optional
+from types import MappingProxyType
+from typing import List, Dict, FrozenSet, Optional
+
+log = logging.getLogger(__name__)
 
 # ==============================================================================
 # CLASE BASE ABSTRACTA - DEMOSTRACIÓN DE ABSTRACCIÓN
@@ -21,9 +30,16 @@ class Libro(ABC):
         _año_publicacion: Año de publicación (privado)
         _disponible: Estado de disponibilidad (privado)
         _fecha_prestamo: Fecha del préstamo actual (privado)
+        _fecha_prestamo_ts: Fecha del préstamo actual como timestamp (privado)
         _usuario_actual: Usuario que tiene el libro prestado (privado)
+        _prestamo_record: Entrada abierta del historial del usuario actual (privado)
     """
     
+    # __slots__: Atributos fijos del objeto, sin __dict__ por instancia
+    __slots__ = ('_titulo', '_autor', '_isbn', '_año_publicacion',
+                 '_disponible', '_fecha_prestamo', '_fecha_prestamo_ts',
+                 '_usuario_actual', '_prestamo_record')
+    
     def __init__(self, titulo: str, autor: str, isbn: str, año_publicacion: int):
         """
         Constructor de la clase base Libro.
@@ -34,13 +50,15 @@ class Libro(ABC):
         # ENCAPSULACIÓN: Atributos privados para proteger los datos
         self._titulo = titulo
         self._autor = autor
-        self._isbn = isbn
+        self._isbn = sys.intern(isbn)
         self._año_publicacion = año_publicacion
         self._disponible = True
         self._fecha_prestamo = None
+        self._fecha_prestamo_ts = 0.0
         self._usuario_actual = None
+        self._prestamo_record: Optional[dict] = None
         
-        print(f"📚 Libro creado: {titulo} por {autor}")
+        log.info("📚 Libro creado: %s por %s", titulo, autor)
     
     # PROPIEDADES - IMPLEMENTACIÓN DE ENCAPSULACIÓN
     @property
@@ -78,6 +96,11 @@ class Libro(ABC):
         """Getter para la fecha de préstamo"""
         return self._fecha_prestamo
     
+    @property
+    def fecha_prestamo_ts(self) -> float:
+        """Getter para la fecha de préstamo como timestamp (0.0 si está disponible)"""
+        return self._fecha_prestamo_ts
+    
     # MÉTODOS ABSTRACTOS - POLIMORFISMO
     @abstractmethod
     def calcular_dias_prestamo(self) -> int:
@@ -110,35 +133,41 @@ class Libro(ABC):
         pass
     
     # MÉTODOS CONCRETOS COMUNES
-    def prestar(self, usuario) -> bool:
+    def prestar(self, usuario, now: Optional[datetime] = None) -> bool:
         """
         Presta el libro a un usuario específico.
         
         Args:
             usuario: Usuario al que se le presta el libro
+            now: Momento del préstamo (por defecto, la hora actual)
             
         Returns:
             bool: True si el préstamo fue exitoso, False en caso contrario
         """
         if self._disponible:
             self._disponible = False
-            self._fecha_prestamo = datetime.now()
+            self._fecha_prestamo = now if now is not None else datetime.now()
+            self._fecha_prestamo_ts = self._fecha_prestamo.timestamp()
             self._usuario_actual = usuario
-            print(f"✅ Préstamo realizado: {self._titulo} para {usuario.nombre}")
+            log.info("✅ Préstamo realizado: %s para %s", self._titulo, usuario.nombre)
             return True
         else:
-            print(f"❌ El libro {self._titulo} no está disponible")
+            log.info("❌ El libro %s no está disponible", self._titulo)
             return False
     
-    def devolver(self) -> tuple:
+    def devolver(self, now: Optional[datetime] = None) -> tuple:
         """
         Devuelve el libro y calcula días de retraso si los hay.
         
+        Args:
+            now: Momento de la devolución (por defecto, la hora actual)
+            
         Returns:
             tuple: (días_retraso, usuario_que_devolvio)
         """
         if not self._disponible:
-            dias_prestado = (datetime.now() - self._fecha_prestamo).days
+            ahora_ts = now.timestamp() if now is not None else time.time()
+            dias_prestado = int((ahora_ts - self._fecha_prestamo_ts) // 86400)
             dias_limite = self.calcular_dias_prestamo()
             dias_retraso = max(0, dias_prestado - dias_limite)
             
@@ -148,29 +177,34 @@ class Libro(ABC):
             # Restaurar estado del libro
             self._disponible = True
             self._fecha_prestamo = None
+            self._fecha_prestamo_ts = 0.0
             self._usuario_actual = None
             
             if dias_retraso > 0:
-                print(f"📅 Libro devuelto con {dias_retraso} días de retraso")
+                log.info("📅 Libro devuelto con %s días de retraso", dias_retraso)
             else:
-                print(f"✅ Libro devuelto a tiempo: {self._titulo}")
+                log.info("✅ Libro devuelto a tiempo: %s", self._titulo)
             
             return dias_retraso, usuario_devolvio
         else:
-            print(f"⚠️  El libro {self._titulo} no estaba prestado")
+            log.info("⚠️  El libro %s no estaba prestado", self._titulo)
             return 0, None
     
-    def obtener_estado(self) -> str:
+    def obtener_estado(self, now: Optional[datetime] = None) -> str:
         """
         Obtiene el estado actual del libro.
         
+        Args:
+            now: Momento de referencia (por defecto, la hora actual)
+            
         Returns:
             str: Estado del libro (disponible o prestado)
         """
         if self._disponible:
             return "Disponible"
         else:
-            dias_prestado = (datetime.now() - self._fecha_prestamo).days
+            ahora_ts = now.timestamp() if now is not None else time.time()
+            dias_prestado = int((ahora_ts - self._fecha_prestamo_ts) // 86400)
             return f"Prestado hace {dias_prestado} días a {self._usuario_actual.nombre}"
     
     def __str__(self) -> str:
@@ -198,6 +232,12 @@ class LibroFisico(Libro):
         _numero_paginas: Cantidad de páginas
     """
     
+    __slots__ = ('_ubicacion', '_estado_fisico', '_numero_paginas')
+    
+    # CONSTANTES DE CLASE
+    _DIAS_PRESTAMO = 14
+    _TIPO = "Libro Físico"
+    
     def __init__(self, titulo: str, autor: str, isbn: str, año_publicacion: int,
                  ubicacion: str, estado_fisico: str = "Bueno", numero_paginas: int = 0):
         """
@@ -213,7 +253,7 @@ class LibroFisico(Libro):
         self._estado_fisico = estado_fisico
         self._numero_paginas = numero_paginas
         
-        print(f"📍 Libro físico ubicado en: {ubicacion}")
+        log.info("📍 Libro físico ubicado en: %s", ubicacion)
     
     # PROPIEDADES ESPECÍFICAS
     @property
@@ -239,7 +279,7 @@ class LibroFisico(Libro):
         Returns:
             int: 14 días para libros físicos
         """
-        return 14
+        return self._DIAS_PRESTAMO
     
     def obtener_tipo(self) -> str:
         """
@@ -248,7 +288,7 @@ class LibroFisico(Libro):
         Returns:
             str: "Libro Físico"
         """
-        return "Libro Físico"
+        return self._TIPO
     
     def obtener_informacion_especifica(self) -> str:
         """
@@ -269,7 +309,7 @@ class LibroFisico(Libro):
         """
         ubicacion_anterior = self._ubicacion
         self._ubicacion = nueva_ubicacion
-        print(f"📦 Libro reubicado de {ubicacion_anterior} a {nueva_ubicacion}")
+        log.info("📦 Libro reubicado de %s a %s", ubicacion_anterior, nueva_ubicacion)
     
     def actualizar_estado_fisico(self, nuevo_estado: str) -> None:
         """
@@ -280,7 +320,7 @@ class LibroFisico(Libro):
         """
         estado_anterior = self._estado_fisico
         self._estado_fisico = nuevo_estado
-        print(f"🔄 Estado físico actualizado de '{estado_anterior}' a '{nuevo_estado}'")
+        log.info("🔄 Estado físico actualizado de '%s' a '%s'", estado_anterior, nuevo_estado)
     
     def necesita_mantenimiento(self) -> bool:
         """
@@ -291,6 +331,18 @@ class LibroFisico(Libro):
         """
         return self._estado_fisico.lower() in ["malo", "regular"]
 
+# Formatos compatibles por dispositivo (constante de módulo, se construye una sola vez)
+_COMPATIBILIDAD: Dict[str, FrozenSet[str]] = {
+    'kindle': frozenset(('MOBI', 'AZW', 'PDF')),
+    'tablet': frozenset(('PDF', 'EPUB', 'MOBI')),
+    'ereader': frozenset(('EPUB', 'PDF')),
+    'computadora': frozenset(('PDF', 'EPUB', 'MOBI', 'TXT'))
+}
+
+# Umbrales de descargas (más de 10: Media, más de 50: Alta) y etiqueta de cada tramo
+_POP_THRESHOLDS = (10, 50)
+_POP_LABELS = ('Baja', 'Media', 'Alta')
+
 class LibroDigital(Libro):
     """
     Clase que representa un libro digital en la biblioteca.
@@ -303,8 +355,16 @@ class LibroDigital(Libro):
         _tamaño_mb: Tamaño del archivo en megabytes
         _url_descarga: URL para descargar el libro
         _descargas: Contador de descargas realizadas
+        _estadisticas_cache: Últimas estadísticas calculadas (None si hay que recalcular)
     """
     
+    __slots__ = ('_formato', '_tamaño_mb', '_url_descarga', '_descargas',
+                 '_estadisticas_cache')
+    
+    # CONSTANTES DE CLASE
+    _DIAS_PRESTAMO = 7
+    _TIPO = "Libro Digital"
+    
     def __init__(self, titulo: str, autor: str, isbn: str, año_publicacion: int,
                  formato: str, tamaño_mb: float, url_descarga: str):
         """
@@ -316,12 +376,13 @@ class LibroDigital(Libro):
         super().__init__(titulo, autor, isbn, año_publicacion)
         
         # Atributos específicos de libros digitales
-        self._formato = formato.upper()
+        self._formato = sys.intern(formato.upper())
         self._tamaño_mb = tamaño_mb
         self._url_descarga = url_descarga
         self._descargas = 0
+        self._estadisticas_cache: Optional[Dict[str, any]] = None
         
-        print(f"💾 Libro digital en formato {formato} ({tamaño_mb} MB)")
+        log.info("💾 Libro digital en formato %s (%s MB)", formato, tamaño_mb)
     
     # PROPIEDADES ESPECÍFICAS
     @property
@@ -352,7 +413,7 @@ class LibroDigital(Libro):
         Returns:
             int: 7 días para libros digitales
         """
-        return 7
+        return self._DIAS_PRESTAMO
     
     def obtener_tipo(self) -> str:
         """
@@ -361,7 +422,7 @@ class LibroDigital(Libro):
         Returns:
             str: "Libro Digital"
         """
-        return "Libro Digital"
+        return self._TIPO
     
     def obtener_informacion_especifica(self) -> str:
         """
@@ -378,21 +439,26 @@ class LibroDigital(Libro):
         Registra una descarga del libro digital.
         """
         self._descargas += 1
-        print(f"⬇️  Descarga registrada. Total: {self._descargas}")
+        self._estadisticas_cache = None
+        log.info("⬇️  Descarga registrada. Total: %s", self._descargas)
     
     def obtener_estadisticas_descarga(self) -> Dict[str, any]:
         """
         Obtiene estadísticas de descarga del libro.
         
+        Las estadísticas se memorizan hasta la siguiente descarga registrada.
+        
         Returns:
             dict: Diccionario con estadísticas de descarga
         """
-        return {
-            'total_descargas': self._descargas,
-            'formato': self._formato,
-            'tamaño_mb': self._tamaño_mb,
-            'popularidad': 'Alta' if self._descargas > 50 else 'Media' if self._descargas > 10 else 'Baja'
-        }
+        if self._estadisticas_cache is None:
+            self._estadisticas_cache = {
+                'total_descargas': self._descargas,
+                'formato': self._formato,
+                'tamaño_mb': self._tamaño_mb,
+                'popularidad': _POP_LABELS[bisect_left(_POP_THRESHOLDS, self._descargas)]
+            }
+        return dict(self._estadisticas_cache)
     
     def es_formato_compatible(self, dispositivo: str) -> bool:
         """
@@ -404,14 +470,7 @@ class LibroDigital(Libro):
         Returns:
             bool: True si es compatible
         """
-        compatibilidad = {
-            'kindle': ['MOBI', 'AZW', 'PDF'],
-            'tablet': ['PDF', 'EPUB', 'MOBI'],
-            'ereader': ['EPUB', 'PDF'],
-            'computadora': ['PDF', 'EPUB', 'MOBI', 'TXT']
-        }
-        
-        return self._formato in compatibilidad.get(dispositivo.lower(), [])
+        return self._formato in _COMPATIBILIDAD.get(dispositivo.lower(), frozenset())
 
 # ==============================================================================
 # JERARQUÍA DE USUARIOS - MÁS HERENCIA Y POLIMORFISMO
@@ -429,11 +488,19 @@ class Usuario(ABC):
         _identificacion: ID único del usuario
         _email: Correo electrónico
         _fecha_registro: Fecha de registro en el sistema
-        _libros_prestados: Lista de libros actualmente prestados
+        _libros_prestados: Libros actualmente prestados (id(libro) -> libro)
         _historial_prestamos: Historial completo de préstamos
         _multa_acumulada: Multa total acumulada
+        _puede_prestar: Indica si puede tomar más préstamos (se recalcula al cambiar)
+        _version: Contador que aumenta con cada cambio de estado del usuario
+        _resumen_cache: Último resumen calculado y la versión a la que corresponde
     """
     
+    # __slots__: Atributos fijos del objeto, sin __dict__ por instancia
+    __slots__ = ('_nombre', '_identificacion', '_email', '_fecha_registro',
+                 '_libros_prestados', '_historial_prestamos', '_multa_acumulada',
+                 '_puede_prestar', '_version', '_resumen_cache')
+    
     def __init__(self, nombre: str, identificacion: str, email: str):
         """
         Constructor base para usuarios.
@@ -448,11 +515,14 @@ class Usuario(ABC):
         self._identificacion = identificacion
         self._email = email
         self._fecha_registro = datetime.now()
-        self._libros_prestados: List[Libro] = []
+        self._libros_prestados: Dict[int, Libro] = {}
         self._historial_prestamos: List[Dict] = []
         self._multa_acumulada = 0.0
+        self._puede_prestar = True
+        self._version = 0
+        self._resumen_cache: tuple = (None, -1)
         
-        print(f"👤 Usuario registrado: {nombre} ({identificacion})")
+        log.info("👤 Usuario registrado: %s (%s)", nombre, identificacion)
     
     # PROPIEDADES - ENCAPSULACIÓN
     @property
@@ -477,8 +547,19 @@ class Usuario(ABC):
     
     @property
     def libros_prestados(self) -> List[Libro]:
-        """Getter que retorna una copia de los libros prestados"""
-        return self._libros_prestados.copy()
+        """
+        Getter que retorna una lista con los libros prestados.
+        
+        Obsoleto: usar libros_prestados_view, que no copia los datos.
+        """
+        warnings.warn("libros_prestados está obsoleto; usar libros_prestados_view",
+                      DeprecationWarning, stacklevel=2)
+        return list(self._libros_prestados.values())
+    
+    @property
+    def libros_prestados_view(self) -> MappingProxyType:
+        """Getter que retorna una vista de solo lectura (id(libro) -> libro) de los libros prestados"""
+        return MappingProxyType(self._libros_prestados)
     
     @property
     def multa_acumulada(self) -> float:
@@ -529,71 +610,88 @@ class Usuario(ABC):
         Returns:
             bool: True si puede prestar, False en caso contrario
         """
+        return self._puede_prestar
+    
+    def _recompute_puede_prestar(self) -> None:
+        """Recalcula _puede_prestar tras cambiar los préstamos o la multa"""
         dentro_limite = len(self._libros_prestados) < self.limite_prestamos()
         sin_multas = self._multa_acumulada == 0
-        return dentro_limite and sin_multas
+        self._puede_prestar = dentro_limite and sin_multas
     
-    def prestar_libro(self, libro: Libro) -> bool:
+    def prestar_libro(self, libro: Libro, now: Optional[datetime] = None) -> bool:
         """
         Realiza el préstamo de un libro al usuario.
         
         Args:
             libro: Libro a prestar
+            now: Momento del préstamo (por defecto, la hora actual)
             
         Returns:
             bool: True si el préstamo fue exitoso
         """
-        if self.puede_prestar() and libro.prestar(self):
-            self._libros_prestados.append(libro)
+        if now is None:
+            now = datetime.now()
+        if self._puede_prestar and libro.prestar(self, now):
+            self._libros_prestados[id(libro)] = libro
             
             # Registrar en historial
             self._historial_prestamos.append({
                 'libro_titulo': libro.titulo,
                 'libro_isbn': libro.isbn,
-                'fecha_prestamo': datetime.now(),
+                'fecha_prestamo': now,
                 'tipo_libro': libro.obtener_tipo(),
                 'devuelto': False
             })
+            libro._prestamo_record = self._historial_prestamos[-1]
+            self._recompute_puede_prestar()
+            self._version += 1
             
-            print(f"📖 Préstamo exitoso: {libro.titulo} para {self._nombre}")
+            log.info("📖 Préstamo exitoso: %s para %s", libro.titulo, self._nombre)
             return True
         else:
-            motivo = "límite excedido" if len(self._libros_prestados) >= self.limite_prestamos() else "multas pendientes"
-            print(f"❌ No se puede prestar libro: {motivo}")
+            # El motivo solo se calcula si alguien va a leer el mensaje
+            if log.isEnabledFor(logging.INFO):
+                motivo = "límite excedido" if len(self._libros_prestados) >= self.limite_prestamos() else "multas pendientes"
+                log.info("❌ No se puede prestar libro: %s", motivo)
             return False
     
-    def devolver_libro(self, libro: Libro) -> float:
+    def devolver_libro(self, libro: Libro, now: Optional[datetime] = None) -> float:
         """
         Devuelve un libro y calcula multa si hay retraso.
         
         Args:
             libro: Libro a devolver
+            now: Momento de la devolución (por defecto, la hora actual)
             
         Returns:
             float: Multa aplicada por retraso
         """
-        if libro in self._libros_prestados:
-            dias_retraso, _ = libro.devolver()
-            self._libros_prestados.remove(libro)
+        if id(libro) in self._libros_prestados:
+            if now is None:
+                now = datetime.now()
+            dias_retraso, _ = libro.devolver(now)
+            del self._libros_prestados[id(libro)]
+            self._version += 1
             
-            # Actualizar historial
-            for prestamo in reversed(self._historial_prestamos):
-                if prestamo['libro_isbn'] == libro.isbn and not prestamo['devuelto']:
-                    prestamo['devuelto'] = True
-                    prestamo['fecha_devolucion'] = datetime.now()
-                    prestamo['dias_retraso'] = dias_retraso
-                    break
+            # Actualizar historial mediante la referencia guardada en el libro
+            prestamo = libro._prestamo_record
+            if prestamo is not None:
+                prestamo['devuelto'] = True
+                prestamo['fecha_devolucion'] = now
+                prestamo['dias_retraso'] = dias_retraso
+                libro._prestamo_record = None
             
             # Calcular multa
             multa = 0.0
             if dias_retraso > 0:
                 multa = dias_retraso * self.calcular_multa_por_dia()
                 self._multa_acumulada += multa
-                print(f"💰 Multa aplicada: ${multa:.2f} por {dias_retraso} días de retraso")
+                log.info("💰 Multa aplicada: $%.2f por %s días de retraso", multa, dias_retraso)
             
+            self._recompute_puede_prestar()
             return multa
         else:
-            print(f"⚠️  El usuario {self._nombre} no tiene prestado el libro {libro.titulo}")
+            log.info("⚠️  El usuario %s no tiene prestado el libro %s", self._nombre, libro.titulo)
             return 0.0
     
     def pagar_multa(self, cantidad: float) -> float:
@@ -608,17 +706,26 @@ class Usuario(ABC):
         """
         if cantidad > 0:
             self._multa_acumulada = max(0, self._multa_acumulada - cantidad)
-            print(f"💳 Pago de multa realizado: ${cantidad:.2f}. Multa restante: ${self._multa_acumulada:.2f}")
+            self._recompute_puede_prestar()
+            self._version += 1
+            log.info("💳 Pago de multa realizado: $%.2f. Multa restante: $%.2f", cantidad, self._multa_acumulada)
         return self._multa_acumulada
     
     def obtener_resumen(self) -> Dict[str, any]:
         """
         Obtiene un resumen completo del usuario.
         
+        El resumen se memoriza y solo se reconstruye cuando cambia
+        la versión del usuario (préstamos, devoluciones, pagos, etc.).
+        
         Returns:
             dict: Resumen con toda la información del usuario
         """
-        return {
+        resumen, version = self._resumen_cache
+        if version == self._version:
+            return dict(resumen)
+        
+        resumen = {
             'nombre': self._nombre,
             'tipo': self.obtener_tipo_usuario(),
             'identificacion': self._identificacion,
@@ -628,8 +735,10 @@ class Usuario(ABC):
             'limite_prestamos': self.limite_prestamos(),
             'total_prestamos_historicos': self.total_prestamos_historicos,
             'multa_acumulada': self._multa_acumulada,
-            'puede_prestar': self.puede_prestar()
+            'puede_prestar': self._puede_prestar
         }
+        self._resumen_cache = (resumen, self._version)
+        return dict(resumen)
     
     def __str__(self) -> str:
         """Representación en cadena del usuario"""
@@ -651,6 +760,13 @@ class Estudiante(Usuario):
         _semestre: Semestre actual
     """
     
+    __slots__ = ('_carrera', '_semestre')
+    
+    # CONSTANTES DE CLASE
+    _LIMITE = 3
+    _MULTA_DIA = 0.50
+    _TIPO = "Estudiante"
+    
     def __init__(self, nombre: str, identificacion: str, email: str, carrera: str, semestre: int = 1):
         """
         Constructor de Estudiante.
@@ -666,7 +782,7 @@ class Estudiante(Usuario):
         self._carrera = carrera
         self._semestre = semestre
         
-        print(f"🎓 Estudiante de {carrera}, semestre {semestre}")
+        log.info("🎓 Estudiante de %s, semestre %s", carrera, semestre)
     
     @property
     def carrera(self) -> str:
@@ -686,7 +802,7 @@ class Estudiante(Usuario):
         Returns:
             int: 3 libros para estudiantes
         """
-        return 3
+        return self._LIMITE
     
     def calcular_multa_por_dia(self) -> float:
         """
@@ -695,7 +811,7 @@ class Estudiante(Usuario):
         Returns:
             float: $0.50 por día
         """
-        return 0.50
+        return self._MULTA_DIA
     
     def obtener_tipo_usuario(self) -> str:
         """
@@ -704,13 +820,14 @@ class Estudiante(Usuario):
         Returns:
             str: "Estudiante"
         """
-        return "Estudiante"
+        return self._TIPO
     
     # MÉTODOS ESPECÍFICOS DE ESTUDIANTES
     def avanzar_semestre(self) -> None:
         """Avanza al siguiente semestre"""
         self._semestre += 1
-        print(f"📚 {self._nombre} avanzó al semestre {self._semestre}")
+        self._version += 1
+        log.info("📚 %s avanzó al semestre %s", self._nombre, self._semestre)
     
     def cambiar_carrera(self, nueva_carrera: str) -> None:
         """
@@ -721,7 +838,8 @@ class Estudiante(Usuario):
         """
         carrera_anterior = self._carrera
         self._carrera = nueva_carrera
-        print(f"🔄 {self._nombre} cambió de {carrera_anterior} a {nueva_carrera}")
+        self._version += 1
+        log.info("🔄 %s cambió de %s a %s", self._nombre, carrera_anterior, nueva_carrera)
 
 class Profesor(Usuario):
     """
@@ -735,6 +853,13 @@ class Profesor(Usuario):
         _titulo_academico: Título académico del profesor
     """
     
+    __slots__ = ('_departamento', '_titulo_academico')
+    
+    # CONSTANTES DE CLASE
+    _LIMITE = 10
+    _MULTA_DIA = 1.00
+    _TIPO = "Profesor"
+    
     def __init__(self, nombre: str, identificacion: str, email: str, 
                  departamento: str, titulo_academico: str = "Profesor"):
         """
@@ -751,7 +876,7 @@ class Profesor(Usuario):
         self._departamento = departamento
         self._titulo_academico = titulo_academico
         
-        print(f"👨‍🏫 {titulo_academico} del departamento de {departamento}")
+        log.info("👨‍🏫 %s del departamento de %s", titulo_academico, departamento)
     
     @property
     def departamento(self) -> str:
@@ -771,7 +896,7 @@ class Profesor(Usuario):
         Returns:
             int: 10 libros para profesores
         """
-        return 10
+        return self._LIMITE
     
     def calcular_multa_por_dia(self) -> float:
         """
@@ -780,7 +905,7 @@ class Profesor(Usuario):
         Returns:
             float: $1.00 por día
         """
-        return 1.00
+        return self._MULTA_DIA
     
     def obtener_tipo_usuario(self) -> str:
         """
@@ -789,7 +914,7 @@ class Profesor(Usuario):
         Returns:
             str: "Profesor"
         """
-        return "Profesor"
+        return self._TIPO
     
     # MÉTODOS ESPECÍFICOS DE PROFESORES
     def solicitar_libro_especializado(self, titulo: str) -> str:
@@ -803,7 +928,7 @@ class Profesor(Usuario):
             str: Número de solicitud
         """
         solicitud_id = f"SOL-{datetime.now().strftime('%Y%m%d%H%M%S')}"
-        print(f"📋 Solicitud de libro especializado: {titulo} (ID: {solicitud_id})")
+        log.info("📋 Solicitud de libro especializado: %s (ID: %s)", titulo, solicitud_id)
         return solicitud_id
     
     def cambiar_departamento(self, nuevo_departamento: str) -> None:
@@ -815,7 +940,38 @@ class Profesor(Usuario):
         """
         departamento_anterior = self._departamento
         self._departamento = nuevo_departamento
-        print(f"🏢 {self._nombre} se trasladó de {departamento_anterior} a {nuevo_departamento}")
+        self._version += 1
+        log.info("🏢 %s se trasladó de %s a %s", self._nombre, departamento_anterior, nuevo_departamento)
+
+# ==============================================================================
+# ESTADÍSTICAS MASIVAS DEL CATÁLOGO
+# ==============================================================================
+
+def calcular_retrasos(timestamps: array, limites: array, ahora_ts: float) -> array:
+    """
+    Calcula los días de retraso de muchos préstamos a la vez.
+    
+    Trabaja sobre arreglos paralelos de números (un elemento por libro)
+    en lugar de recorrer los objetos Libro, de modo que el ciclo interno
+    solo hace aritmética sobre valores ya extraídos.
+    
+    Args:
+        timestamps: Fechas de préstamo como timestamps (ver Libro.fecha_prestamo_ts);
+            0.0 indica un libro disponible, que no tiene retraso
+        limites: Días de préstamo permitidos de cada libro
+        ahora_ts: Momento de referencia como timestamp
+        
+    Returns:
+        array: Días de retraso de cada libro (0 si no hay retraso)
+    """
+    retrasos = array('i', [0]) * len(timestamps)
+    for i, (ts, limite) in enumerate(zip(timestamps, limites)):
+        if ts == 0.0:
+            continue
+        dias = int((ahora_ts - ts) // 86400) - limite
+        if dias > 0:
+            retrasos[i] = dias
+    return retrasos
 
 # ==============================================================================
 # CLASE PRINCIPAL DEL SISTEMA - COMPOSICIÓN
@@ -830,6 +986,7 @@ class Biblioteca:
     """
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
     print("Bienvenido al sistema de biblioteca")
     # Aquí puedes crear objetos y probar funcionalidades
     # Por ejemplo:
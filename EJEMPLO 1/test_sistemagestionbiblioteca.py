@@ -0,0 +1,55 @@
+import unittest
+from datetime import datetime, timedelta
+
+from Sistemagestionbliblioteca import Estudiante, LibroFisico
+
+
+class Posgrado(Estudiante):
+    """Estudiante que redefine las reglas heredadas sin tocar las constantes"""
+
+    def limite_prestamos(self) -> int:
+        return 1
+
+    def calcular_multa_por_dia(self) -> float:
+        return 5.0
+
+    def obtener_tipo_usuario(self) -> str:
+        return "Posgrado"
+
+
+class Express(LibroFisico):
+    """Libro físico de préstamo corto"""
+
+    def calcular_dias_prestamo(self) -> int:
+        return 1
+
+    def obtener_tipo(self) -> str:
+        return "Express"
+
+
+class TestPolimorfismo(unittest.TestCase):
+    """Los métodos redefinidos en una subclase deben respetarse"""
+
+    def setUp(self):
+        self.usuario = Posgrado("Ana", "P-1", "ana@correo.com", "Física")
+        self.libro = Express("Libro A", "Autor", "111", 2020, "A1")
+        self.otro = Express("Libro B", "Autor", "222", 2020, "A2")
+
+    def test_limite_redefinido(self):
+        self.assertTrue(self.usuario.prestar_libro(self.libro))
+        self.assertFalse(self.usuario.prestar_libro(self.otro))
+        self.assertEqual(self.usuario.obtener_resumen()['limite_prestamos'], 1)
+
+    def test_dias_y_multa_redefinidos(self):
+        ahora = datetime.now()
+        self.usuario.prestar_libro(self.libro, ahora - timedelta(days=5))
+        self.assertEqual(self.usuario.devolver_libro(self.libro, ahora), 20.0)
+
+    def test_tipo_redefinido_en_textos(self):
+        self.assertTrue(str(self.libro).startswith("Express: "))
+        self.assertTrue(str(self.usuario).startswith("Posgrado: "))
+        self.assertIn("tipo='Posgrado'", repr(self.usuario))
+
+
+if __name__ == "__main__":
+    unittest.main()
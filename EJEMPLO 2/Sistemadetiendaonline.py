@@ -21,11 +21,21 @@ CONCEPTOS DEL MUNDO REAL MODELADOS:
 - Métodos de pago y facturación
 """
 
+from __future__ import annotations
+
 from abc import ABC, abstractmethod
-from datetime import datetime, timedelta
-from enum import Enum
-from typing import List, Dict, Optional
-import uuid
+from array import array
+from enum import Enum, IntEnum
+from itertools import count
+
+from tienda_kernels import (aplicar_descuento_kernel, descuento_por_categoria_kernel,
+                            indices_por_precio, make_discount_applier, reducir_stock_kernel,
+                            top_k_por_precio, valor_inventario)
+
+# Los tipos solo se usan en anotaciones: typing no se importa al ejecutar
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from typing import List, Dict, Optional
 
 # ENUMERACIONES PARA ESTADOS
 class EstadoPedido(Enum):
@@ -35,12 +45,30 @@ class EstadoPedido(Enum):
     ENTREGADO = "Entregado"
     CANCELADO = "Cancelado"
 
-class CategoriaProducto(Enum):
-    ELECTRONICA = "Electrónica"
-    ROPA = "Ropa"
-    HOGAR = "Hogar"
-    LIBROS = "Libros"
-    DEPORTES = "Deportes"
+# IntEnum: cada categoría es un entero pequeño que se guarda tal cual
+# en los arreglos del catálogo y se compara como número
+class CategoriaProducto(IntEnum):
+    ELECTRONICA = 0
+    ROPA = 1
+    HOGAR = 2
+    LIBROS = 3
+    DEPORTES = 4
+    
+    @property
+    def etiqueta(self) -> str:
+        """Nombre de la categoría para mostrar"""
+        return _ETIQUETAS_CATEGORIA[self]
+
+_ETIQUETAS_CATEGORIA = {
+    CategoriaProducto.ELECTRONICA: "Electrónica",
+    CategoriaProducto.ROPA: "Ropa",
+    CategoriaProducto.HOGAR: "Hogar",
+    CategoriaProducto.LIBROS: "Libros",
+    CategoriaProducto.DEPORTES: "Deportes"
+}
+
+# Generador de IDs numéricos compartido por todos los productos
+_id_counter = count(1)
 
 # INTERFACE/PROTOCOLO PARA DESCUENTOS
 class Descuentable(ABC):
@@ -49,6 +77,8 @@ class Descuentable(ABC):
     Demuestra el concepto de ABSTRACCIÓN mediante interfaces.
     """
     
+    __slots__ = ()
+    
     @abstractmethod
     def aplicar_descuento(self, porcentaje: float) -> float:
         """Aplica un descuento y retorna el nuevo precio"""
@@ -66,13 +96,18 @@ class Producto(Descuentable):
     Demuestra ENCAPSULACIÓN y implementa la interfaz Descuentable.
     """
     
-    # ATRIBUTO DE CLASE - CONTADOR DE PRODUCTOS
-    _contador_productos = 0
+    # __slots__: Atributos fijos del objeto, sin __dict__ por instancia.
+    # Mientras el producto no pertenece a un catálogo, precio, stock y ventas
+    # se guardan en sus propios slots; al agregarlo a un CatalogoSoA pasan a
+    # los arreglos del catálogo (_catalogo), en la posición _idx.
+    __slots__ = ('_id', '_nombre', '_precio_original', '_precio_actual',
+                 '_categoria', '_stock', '_descripcion', '_ventas_totales',
+                 '_catalogo', '_idx', '_str_cache')
     
     def __init__(self, nombre: str, precio: float, categoria: CategoriaProducto, 
                  stock: int, descripcion: str = ""):
         # ENCAPSULACIÓN - Atributos privados
-        self._id = self._generar_id()
+        self._id = next(_id_counter)
         self._nombre = nombre
         self._precio_original = precio
         self._precio_actual = precio
@@ -80,14 +115,9 @@ class Producto(Descuentable):
         self._stock = stock
         self._descripcion = descripcion
         self._ventas_totales = 0
-        
-        # Incrementar contador de clase
-        Producto._contador_productos += 1
-    
-    @classmethod
-    def _generar_id(cls) -> str:
-        """MÉTODO DE CLASE para generar IDs únicos"""
-        return f"PROD-{cls._contador_productos + 1:04d}"
+        self._catalogo: Optional[CatalogoSoA] = None
+        self._idx = -1
+        self._str_cache: Optional[str] = None
     
     @staticmethod
     def validar_precio(precio: float) -> bool:
@@ -97,7 +127,7 @@ class Producto(Descuentable):
     # PROPIEDADES - ENCAPSULACIÓN
     @property
     def id(self) -> str:
-        return self._id
+        return f"PROD-{self._id:04d}"
     
     @property
     def nombre(self) -> str:
@@ -105,7 +135,8 @@ class Producto(Descuentable):
     
     @property
     def precio(self) -> float:
-        return self._precio_actual
+        catalogo = self._catalogo
+        return self._precio_actual if catalogo is None else catalogo._precios[self._idx]
     
     @property
     def categoria(self) -> CategoriaProducto:
@@ -113,64 +144,103 @@ class Producto(Descuentable):
     
     @property
     def stock(self) -> int:
-        return self._stock
+        catalogo = self._catalogo
+        return self._stock if catalogo is None else catalogo._stock[self._idx]
     
     @property
     def disponible(self) -> bool:
         """PROPIEDAD CALCULADA"""
-        return self._stock > 0
+        return self.stock > 0
     
     @property
     def ventas_totales(self) -> int:
-        return self._ventas_totales
+        catalogo = self._catalogo
+        return self._ventas_totales if catalogo is None else catalogo._ventas[self._idx]
+    
+    @property
+    def catalogo(self) -> Optional[CatalogoSoA]:
+        return self._catalogo
     
     # IMPLEMENTACIÓN DE INTERFAZ DESCUENTABLE
     def aplicar_descuento(self, porcentaje: float) -> float:
         """Aplica descuento al producto"""
         if 0 <= porcentaje <= 100:
-            descuento = self._precio_original * (porcentaje / 100)
-            self._precio_actual = self._precio_original - descuento
-            return self._precio_actual
-        return self._precio_actual
+            original = self.obtener_precio_original()
+            descuento = original * (porcentaje / 100)
+            if self._catalogo is None:
+                self._precio_actual = original - descuento
+            else:
+                self._catalogo._precios[self._idx] = original - descuento
+            self._str_cache = None
+        return self.precio
     
     def obtener_precio_original(self) -> float:
-        return self._precio_original
+        catalogo = self._catalogo
+        return self._precio_original if catalogo is None else catalogo._precios_originales[self._idx]
     
     def restaurar_precio_original(self):
         """Restaura el precio original eliminando descuentos"""
-        self._precio_actual = self._precio_original
+        catalogo = self._catalogo
+        if catalogo is None:
+            self._precio_actual = self._precio_original
+        else:
+            catalogo._precios[self._idx] = catalogo._precios_originales[self._idx]
+        self._str_cache = None
     
     # GESTIÓN DE INVENTARIO
     def reducir_stock(self, cantidad: int) -> bool:
         """Reduce el stock del producto"""
-        if self._stock >= cantidad:
-            self._stock -= cantidad
-            self._ventas_totales += cantidad
+        catalogo = self._catalogo
+        if catalogo is None:
+            if self._stock >= cantidad:
+                self._stock -= cantidad
+                self._ventas_totales += cantidad
+                self._str_cache = None
+                return True
+            return False
+        stock, idx = catalogo._stock, self._idx
+        if stock[idx] >= cantidad:
+            stock[idx] -= cantidad
+            catalogo._ventas[idx] += cantidad
+            self._str_cache = None
             return True
         return False
     
     def reponer_stock(self, cantidad: int):
         """Repone stock del producto"""
-        self._stock += cantidad
+        if self._catalogo is None:
+            self._stock += cantidad
+        else:
+            self._catalogo._stock[self._idx] += cantidad
+        self._str_cache = None
     
     # SOBRECARGA DE OPERADORES
     def __eq__(self, other) -> bool:
         """Sobrecarga del operador == para comparar productos"""
-        if isinstance(other, Producto):
+        try:
             return self._id == other._id
-        return False
+        except AttributeError:
+            return False
     
     def __lt__(self, other) -> bool:
         """Sobrecarga del operador < para comparar por precio"""
-        if isinstance(other, Producto):
-            return self._precio_actual < other._precio_actual
-        return NotImplemented
+        try:
+            return self.precio < other.precio
+        except AttributeError:
+            return NotImplemented
     
     def __str__(self) -> str:
-        return f"{self._nombre} (${self._precio_actual:.2f}) - Stock: {self._stock}"
+        """Texto memorizado; los métodos que cambian precio o stock lo invalidan"""
+        if self._str_cache is None:
+            self._str_cache = self._formatear()
+        return self._str_cache
+    
+    def _formatear(self) -> str:
+        """Construye el texto de __str__; las subclases lo extienden"""
+        return f"{self._nombre} (${self.precio:.2f}) - Stock: {self.stock}"
     
     def __repr__(self) -> str:
-        return f"Producto(id='{self._id}', nombre='{self._nombre}', precio={self._precio_actual})"
+        return f"Producto(id='PROD-{self._id:04d}', nombre='{self._nombre}', precio={self.precio})"
 
 # HERENCIA - PRODUCTOS ESPECIALIZADOS
 class ProductoElectronico(Producto):
@@ -179,6 +249,8 @@ class ProductoElectronico(Producto):
     Demuestra HERENCIA y especialización.
     """
     
+    __slots__ = ('_marca', '_garantia_meses')
+    
     def __init__(self, nombre: str, precio: float, stock: int, marca: str, 
                  garantia_meses: int, descripcion: str = ""):
         super().__init__(nombre, precio, CategoriaProducto.ELECTRONICA, stock, descripcion)
@@ -196,9 +268,10 @@ class ProductoElectronico(Producto):
     def extender_garantia(self, meses_adicionales: int):
         """Método específico de productos electrónicos"""
         self._garantia_meses += meses_adicionales
+        self._str_cache = None
     
-    def __str__(self) -> str:
-        return f"{super().__str__()} - {self._marca} (Garantía: {self._garantia_meses} meses)"
+    def _formatear(self) -> str:
+        return f"{super()._formatear()} - {self._marca} (Garantía: {self._garantia_meses} meses)"
 
 class ProductoRopa(Producto):
     """
@@ -206,6 +279,8 @@ class ProductoRopa(Producto):
     Demuestra HERENCIA y especialización.
     """
     
+    __slots__ = ('_talla', '_color', '_material')
+    
     def __init__(self, nombre: str, precio: float, stock: int, talla: str, 
                  color: str, material: str, descripcion: str = ""):
         super().__init__(nombre, precio, CategoriaProducto.ROPA, stock, descripcion)
@@ -225,8 +300,165 @@ class ProductoRopa(Producto):
     def material(self) -> str:
         return self._material
 
-    def __str__(self) -> str:
-        return f"{super().__str__()} - {self._talla} - {self._color} - {self._material}"
+    def _formatear(self) -> str:
+        return f"{super()._formatear()} - {self._talla} - {self._color} - {self._material}"
+
+# COMPOSICIÓN - CATÁLOGO CON ESTRUCTURA DE ARREGLOS
+class CatalogoSoA:
+    """
+    Catálogo de productos que guarda sus datos numéricos en arreglos paralelos.
+    
+    Al agregar un Producto, su precio, su stock y sus ventas dejan de leerse de
+    sus propios atributos: el catálogo mantiene un arreglo por campo
+    (estructura de arreglos, SoA) y cada producto conoce su posición. Así las
+    operaciones sobre todo el catálogo recorren memoria contigua de números en
+    vez de saltar entre objetos.
+    Demuestra COMPOSICIÓN: el catálogo agrega productos y coordina su inventario.
+    """
+    
+    __slots__ = ('_productos', '_indices', '_precios_originales', '_precios',
+                 '_stock', '_ventas', '_categorias')
+    
+    def __init__(self):
+        self._productos: List[Producto] = []
+        self._indices: Dict[int, int] = {}
+        self._precios_originales = array('d')
+        self._precios = array('d')
+        # stock es int32: agregar un producto con más de 2**31 - 1 unidades, o
+        # reponer por encima de ese límite, lanza OverflowError antes de escribir
+        # nada, y el catálogo y el producto quedan como estaban. Las ventas
+        # acumuladas crecen sin límite práctico y usan int64.
+        self._stock = array('i')
+        self._ventas = array('q')
+        self._categorias = array('b')
+    
+    @staticmethod
+    def _preparar_fila(producto: Producto, precio_original: float, precio: float,
+                       stock: int, ventas: int) -> tuple:
+        """
+        Convierte los valores del producto al tipo de cada arreglo.
+        
+        Cualquier valor que no quepa en su arreglo falla aquí, antes de
+        modificar el catálogo, de modo que nunca quedan arreglos de distinto largo.
+        """
+        return (array('d', [precio_original]), array('d', [precio]),
+                array('i', [stock]), array('q', [ventas]),
+                array('b', [int(producto._categoria)]))
+    
+    def _registrar(self, producto: Producto, fila: tuple):
+        """Añade una fila ya preparada a los arreglos y enlaza el producto con ella"""
+        campos = (self._precios_originales, self._precios, self._stock,
+                  self._ventas, self._categorias)
+        for campo, valor in zip(campos, fila):
+            campo.extend(valor)
+        self._indices[producto._id] = len(self._productos)
+        self._productos.append(producto)
+        producto._catalogo = self
+        producto._idx = len(self._productos) - 1
+    
+    def _quitar(self, producto: Producto):
+        """Elimina la fila del producto moviendo la última a su lugar"""
+        idx = self._indices.pop(producto._id)
+        ultimo = self._productos.pop()
+        campos = (self._precios_originales, self._precios, self._stock,
+                  self._ventas, self._categorias)
+        if ultimo is not producto:
+            self._productos[idx] = ultimo
+            self._indices[ultimo._id] = idx
+            ultimo._idx = idx
+            for campo in campos:
+                campo[idx] = campo[-1]
+        for campo in campos:
+            campo.pop()
+    
+    def agregar(self, producto: Producto):
+        """Mueve el producto a este catálogo conservando precio, stock y ventas"""
+        origen, idx = producto._catalogo, producto._idx
+        if origen is self:
+            return
+        if origen is None:
+            datos = (producto._precio_original, producto._precio_actual,
+                     producto._stock, producto._ventas_totales)
+        else:
+            datos = (origen._precios_originales[idx], origen._precios[idx],
+                     origen._stock[idx], origen._ventas[idx])
+        fila = self._preparar_fila(producto, *datos)
+        if origen is not None:
+            origen._quitar(producto)
+        self._registrar(producto, fila)
+    
+    def _invalidar_textos(self):
+        """Descarta el texto memorizado de los productos tras una operación masiva"""
+        for producto in self._productos:
+            producto._str_cache = None
+    
+    @property
+    def productos(self) -> List[Producto]:
+        return self._productos.copy()
+    
+    def __len__(self) -> int:
+        return len(self._productos)
+    
+    # OPERACIONES MASIVAS SOBRE LOS ARREGLOS
+    def aplicar_descuento_masivo(self, porcentaje: float,
+                                 categoria: Optional[CategoriaProducto] = None):
+        """Aplica un descuento a todo el catálogo o solo a una categoría"""
+        categorias = CategoriaProducto if categoria is None else (categoria,)
+        self.aplicar_descuentos_por_categoria({c: porcentaje for c in categorias})
+    
+    def aplicar_descuentos_por_categoria(self, porcentajes: Dict[CategoriaProducto, float]):
+        """Aplica en una sola pasada un porcentaje distinto a cada categoría indicada"""
+        fracciones: List[Optional[float]] = [None] * len(CategoriaProducto)
+        for categoria, porcentaje in porcentajes.items():
+            if 0 <= porcentaje <= 100:
+                fracciones[categoria] = porcentaje / 100
+        descuento_por_categoria_kernel(self._precios, self._precios_originales,
+                                       self._categorias, fracciones)
+        self._invalidar_textos()
+    
+    def aplicar_promocion(self, porcentaje: float):
+        """Aplica a todo el catálogo una promoción de porcentaje fijo"""
+        if not 0 <= porcentaje <= 100:
+            return
+        make_discount_applier(porcentaje)(self._precios, self._precios_originales)
+        self._invalidar_textos()
+    
+    def reducir_stock_masivo(self, productos: List[Producto], cantidades: List[int]) -> List[bool]:
+        """Descuenta del inventario las unidades de varios pedidos de una vez"""
+        if len(productos) != len(cantidades):
+            raise ValueError("Se necesita una cantidad por cada producto")
+        for producto in productos:
+            if producto._catalogo is not self:
+                raise ValueError(f"{producto.id} no pertenece a este catálogo")
+        indices = array('i', (p._idx for p in productos))
+        atendidos = reducir_stock_kernel(self._stock, self._ventas, indices, array('i', cantidades))
+        for producto, atendido in zip(productos, atendidos):
+            if atendido:
+                producto._str_cache = None
+        return [bool(a) for a in atendidos]
+    
+    def aplicar_descuentos(self, porcentajes: array):
+        """Aplica a cada producto su propio porcentaje (un valor por fila)"""
+        if len(porcentajes) != len(self):
+            raise ValueError("Se necesita un porcentaje por cada producto del catálogo")
+        aplicar_descuento_kernel(self._precios, self._precios_originales, porcentajes)
+        self._invalidar_textos()
+    
+    def valor_total_inventario(self) -> float:
+        """PROPIEDAD CALCULADA: suma de precio actual por stock"""
+        return valor_inventario(self._precios, self._stock)
+    
+    def mas_caros(self, k: int) -> List[Producto]:
+        """Los k productos de mayor precio actual"""
+        return [self._productos[i] for i in top_k_por_precio(self._precios, k)]
+    
+    def ordenados_por_precio(self) -> List[Producto]:
+        """Productos de menor a mayor precio, ordenando los índices del arreglo de precios"""
+        return [self._productos[i] for i in indices_por_precio(self._precios)]
+    
+    def disponibles(self) -> List[Producto]:
+        """Productos con stock mayor que cero"""
+        return [p for p, s in zip(self._productos, self._stock) if s > 0]
 
 if __name__ == "__main__":
     print("Bienvenido al sistema de tienda online")
@@ -0,0 +1,106 @@
+"""
+KERNELS NUMÉRICOS DEL CATÁLOGO - TIENDA ONLINE
+==============================================
+
+Funciones que operan directamente sobre los arreglos paralelos de CatalogoSoA
+(precios, stock, ventas). No reciben objetos Producto ni enumeraciones: solo
+secuencias de números, de modo que el ciclo interno se limita a aritmética.
+
+Las clases del sistema las usan como envoltorios delgados; los kernels no
+conocen nada de la jerarquía de productos.
+"""
+
+from __future__ import annotations
+
+from array import array
+from functools import lru_cache
+from heapq import nlargest
+from operator import mul
+
+# Los tipos solo se usan en anotaciones: typing no se importa al ejecutar
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from typing import Callable, List, Optional, Sequence
+
+
+def aplicar_descuento_kernel(precios_out: array, precios_orig: array, pct_por_item: array) -> None:
+    """
+    Recalcula los precios actuales a partir del original y un descuento por producto.
+
+    Los porcentajes fuera del rango 0-100 dejan el precio actual sin cambios,
+    igual que Producto.aplicar_descuento.
+    """
+    for i in range(len(precios_out)):
+        pct = pct_por_item[i]
+        if 0 <= pct <= 100:
+            precios_out[i] = precios_orig[i] - precios_orig[i] * (pct / 100)
+
+
+@lru_cache(maxsize=16)
+def make_discount_applier(pct: float) -> Callable[[array, array], None]:
+    """
+    Devuelve una función que aplica un descuento fijo a todo un arreglo de precios.
+
+    La fracción pct / 100 se calcula una sola vez y queda capturada en la
+    función, así que aplicarla no repite la división; el precio resultante es
+    el mismo que da Producto.aplicar_descuento. Las promociones suelen usar pocos
+    porcentajes, por lo que se conservan los últimos aplicadores generados.
+    El porcentaje debe estar entre 0 y 100; validarlo corresponde a quien
+    llama, como en CatalogoSoA.aplicar_promocion.
+    """
+    fraccion = pct / 100
+
+    def aplicador(precios_out: array, precios_orig: array) -> None:
+        for i in range(len(precios_out)):
+            precios_out[i] = precios_orig[i] - precios_orig[i] * fraccion
+
+    return aplicador
+
+
+def descuento_por_categoria_kernel(precios_out: array, precios_orig: array, categorias: array,
+                                   fracciones: Sequence[Optional[float]]) -> None:
+    """
+    Aplica a cada producto la fracción de descuento de su categoría.
+
+    fracciones se indexa con la etiqueta entera de la categoría y guarda el
+    porcentaje dividido entre 100; una entrada None deja intactos los precios
+    de esa categoría. Todo el catálogo se recorre una sola vez aunque se
+    rebajen varias categorías a la vez.
+    """
+    for i in range(len(precios_out)):
+        fraccion = fracciones[categorias[i]]
+        if fraccion is not None:
+            precios_out[i] = precios_orig[i] - precios_orig[i] * fraccion
+
+
+def reducir_stock_kernel(stock: array, ventas: array, indices: array, cantidades: array) -> array:
+    """
+    Atiende una serie de pedidos (índice de producto, cantidad) sobre el inventario.
+
+    Cada pedido solo se descuenta si hay stock suficiente en ese momento,
+    como en Producto.reducir_stock. Devuelve 1 por pedido atendido y 0 por
+    pedido rechazado.
+    """
+    atendidos = array('b', [0]) * len(indices)
+    for j in range(len(indices)):
+        i, cantidad = indices[j], cantidades[j]
+        if stock[i] >= cantidad:
+            stock[i] -= cantidad
+            ventas[i] += cantidad
+            atendidos[j] = 1
+    return atendidos
+
+
+def valor_inventario(precios: array, stock: array) -> float:
+    """Suma de precio por unidades en stock de todos los productos"""
+    return sum(map(mul, precios, stock))
+
+
+def top_k_por_precio(precios: array, k: int) -> List[int]:
+    """Índices de los k productos más caros, de mayor a menor precio"""
+    return nlargest(k, range(len(precios)), key=precios.__getitem__)
+
+
+def indices_por_precio(precios: array) -> List[int]:
+    """Índices de los productos ordenados de menor a mayor precio"""
+    return sorted(range(len(precios)), key=precios.__getitem__)